@@ -1,46 +1,77 @@
-import requests
-import json
+import asyncio
+import httpx
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2]);
+# fall back to HTTP/1.1 keep-alive when it is not installed
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 class SurveyAPIClient:
     """Client class to interact with the Survey Data API Gateway"""
-    
+
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
-    
+
+        # One pooled client for all calls: keep-alive connections avoid
+        # the per-request TCP/TLS handshake, and HTTP/2 (when available)
+        # multiplexes the many small /api/* calls over a single stream
+        self._client = httpx.Client(
+            base_url=base_url,
+            timeout=30.0,
+            transport=httpx.HTTPTransport(
+                retries=2,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=32)
+            )
+        )
+
+    def close(self):
+        """Close the underlying HTTP client and its pooled connections"""
+        self._client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def execute_query(self, query: str, database: str = "survey.db"):
         """Execute a SQL query and return results"""
-        response = requests.post(
-            f"{self.base_url}/query",
+        response = self._client.post(
+            "/query",
             json={"query": query, "database": database}
         )
         return response.json()
     
     def analyze_query(self, query: str, database: str = "survey.db"):
         """Analyze a SQL query without executing it"""
-        response = requests.post(
-            f"{self.base_url}/analyze",
+        response = self._client.post(
+            "/analyze",
             json={"query": query, "database": database}
         )
         return response.json()
     
     def list_databases(self):
         """List all available databases"""
-        response = requests.get(f"{self.base_url}/databases")
+        response = self._client.get("/databases")
         return response.json()
     
     def list_tables(self, database: str):
         """List all tables in a database"""
-        response = requests.get(f"{self.base_url}/tables/{database}")
+        response = self._client.get(f"/tables/{database}")
         return response.json()
     
     def get_sample_data(self, database: str, table: str, limit: int = 10):
         """Get sample data from a table"""
-        response = requests.get(f"{self.base_url}/sample/{database}/{table}?limit={limit}")
+        response = self._client.get(f"/sample/{database}/{table}", params={"limit": limit})
         return response.json()
     
     def get_table_schema(self, database: str, table: str):
         """Get schema information for a table"""
-        response = requests.get(f"{self.base_url}/schema/{database}/{table}")
+        response = self._client.get(f"/schema/{database}/{table}")
         return response.json()
     
     # RESTful API methods
@@ -54,7 +85,7 @@ class SurveyAPIClient:
         if created_before:
             params["created_before"] = created_before
             
-        response = requests.get(f"{self.base_url}/api/surveys", params=params)
+        response = self._client.get("/api/surveys", params=params)
         return response.json()
     
     def get_responses(self, survey_id=None, survey_name=None, age_group=None, gender=None, 
@@ -81,7 +112,7 @@ class SurveyAPIClient:
         if response_before:
             params["response_before"] = response_before
             
-        response = requests.get(f"{self.base_url}/api/responses", params=params)
+        response = self._client.get("/api/responses", params=params)
         return response.json()
     
     def get_demographics(self, age_group=None, gender=None, education_level=None, 
@@ -99,7 +130,7 @@ class SurveyAPIClient:
         if location:
             params["location"] = location
             
-        response = requests.get(f"{self.base_url}/api/demographics", params=params)
+        response = self._client.get("/api/demographics", params=params)
         return response.json()
     
     def get_analytics_summary(self, survey_id=None, age_group=None, gender=None, location=None):
@@ -114,94 +145,240 @@ class SurveyAPIClient:
         if location:
             params["location"] = location
             
-        response = requests.get(f"{self.base_url}/api/analytics/summary", params=params)
+        response = self._client.get("/api/analytics/summary", params=params)
         return response.json()
     
     def get_filter_options(self):
         """Get available filter options"""
-        response = requests.get(f"{self.base_url}/api/filters/options")
+        response = self._client.get("/api/filters/options")
+        return response.json()
+
+class AsyncSurveyAPIClient:
+    """Async client for the Survey Data API Gateway built on httpx.
+
+    Methods mirror SurveyAPIClient but are coroutines, so many calls can
+    be issued concurrently with asyncio.gather over one pooled transport.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000"):
+        self.base_url = base_url
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=30.0,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+
+    async def aclose(self):
+        """Close the underlying HTTP client and its pooled connections"""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def execute_query(self, query: str, database: str = "survey.db"):
+        """Execute a SQL query and return results"""
+        response = await self._client.post(
+            "/query",
+            json={"query": query, "database": database}
+        )
+        return response.json()
+
+    async def analyze_query(self, query: str, database: str = "survey.db"):
+        """Analyze a SQL query without executing it"""
+        response = await self._client.post(
+            "/analyze",
+            json={"query": query, "database": database}
+        )
+        return response.json()
+
+    async def list_databases(self):
+        """List all available databases"""
+        response = await self._client.get("/databases")
+        return response.json()
+
+    async def list_tables(self, database: str):
+        """List all tables in a database"""
+        response = await self._client.get(f"/tables/{database}")
+        return response.json()
+
+    async def get_sample_data(self, database: str, table: str, limit: int = 10):
+        """Get sample data from a table"""
+        response = await self._client.get(f"/sample/{database}/{table}", params={"limit": limit})
+        return response.json()
+
+    async def get_table_schema(self, database: str, table: str):
+        """Get schema information for a table"""
+        response = await self._client.get(f"/schema/{database}/{table}")
+        return response.json()
+
+    async def get_surveys(self, status=None, created_after=None, created_before=None, limit=100, offset=0):
+        """Get surveys with optional filtering"""
+        params = {"limit": limit, "offset": offset}
+        if status:
+            params["status"] = status
+        if created_after:
+            params["created_after"] = created_after
+        if created_before:
+            params["created_before"] = created_before
+
+        response = await self._client.get("/api/surveys", params=params)
+        return response.json()
+
+    async def get_responses(self, survey_id=None, survey_name=None, age_group=None, gender=None,
+                            location=None, education_level=None, income_range=None,
+                            response_after=None, response_before=None, limit=100, offset=0):
+        """Get responses with comprehensive filtering"""
+        params = {"limit": limit, "offset": offset}
+        if survey_id:
+            params["survey_id"] = survey_id
+        if survey_name:
+            params["survey_name"] = survey_name
+        if age_group:
+            params["age_group"] = age_group
+        if gender:
+            params["gender"] = gender
+        if location:
+            params["location"] = location
+        if education_level:
+            params["education_level"] = education_level
+        if income_range:
+            params["income_range"] = income_range
+        if response_after:
+            params["response_after"] = response_after
+        if response_before:
+            params["response_before"] = response_before
+
+        response = await self._client.get("/api/responses", params=params)
+        return response.json()
+
+    async def get_demographics(self, age_group=None, gender=None, education_level=None,
+                               income_range=None, location=None, limit=100, offset=0):
+        """Get demographics with filtering"""
+        params = {"limit": limit, "offset": offset}
+        if age_group:
+            params["age_group"] = age_group
+        if gender:
+            params["gender"] = gender
+        if education_level:
+            params["education_level"] = education_level
+        if income_range:
+            params["income_range"] = income_range
+        if location:
+            params["location"] = location
+
+        response = await self._client.get("/api/demographics", params=params)
+        return response.json()
+
+    async def get_analytics_summary(self, survey_id=None, age_group=None, gender=None, location=None):
+        """Get analytics summary with filtering"""
+        params = {}
+        if survey_id:
+            params["survey_id"] = survey_id
+        if age_group:
+            params["age_group"] = age_group
+        if gender:
+            params["gender"] = gender
+        if location:
+            params["location"] = location
+
+        response = await self._client.get("/api/analytics/summary", params=params)
+        return response.json()
+
+    async def get_filter_options(self):
+        """Get available filter options"""
+        response = await self._client.get("/api/filters/options")
         return response.json()
 
 # Example usage and common queries
-def example_queries():
-    """Example queries for the survey database"""
+EXAMPLE_QUERIES = {
+    "all_surveys": "SELECT * FROM surveys",
     
-    queries = {
-        "all_surveys": "SELECT * FROM surveys",
-        
-        "customer_satisfaction_responses": """
-            SELECT 
-                s.survey_name,
-                q.question_text,
-                r.answer_text,
-                r.answer_numeric,
-                d.age_group,
-                d.gender,
-                d.location
-            FROM responses r
-            JOIN surveys s ON r.survey_id = s.survey_id
-            JOIN questions q ON r.question_id = q.question_id
-            LEFT JOIN demographics d ON r.respondent_id = d.respondent_id
-            WHERE s.survey_name = 'Customer Satisfaction Survey'
-        """,
-        
-        "average_ratings": """
-            SELECT 
-                s.survey_name,
-                q.question_text,
-                AVG(r.answer_numeric) as average_rating,
-                COUNT(*) as response_count
-            FROM responses r
-            JOIN surveys s ON r.survey_id = s.survey_id
-            JOIN questions q ON r.question_id = q.question_id
-            WHERE r.answer_numeric IS NOT NULL
-            GROUP BY s.survey_id, q.question_id
-            ORDER BY average_rating DESC
-        """,
-        
-        "demographics_summary": """
-            SELECT 
-                age_group,
-                gender,
-                COUNT(*) as count
-            FROM demographics
-            GROUP BY age_group, gender
-            ORDER BY count DESC
-        """,
-        
-        "response_trends": """
-            SELECT 
-                DATE(r.response_date) as response_date,
-                COUNT(*) as daily_responses
-            FROM responses r
-            GROUP BY DATE(r.response_date)
-            ORDER BY response_date
-        """
-    }
+    "customer_satisfaction_responses": """
+        SELECT 
+            s.survey_name,
+            q.question_text,
+            r.answer_text,
+            r.answer_numeric,
+            d.age_group,
+            d.gender,
+            d.location
+        FROM responses r
+        JOIN surveys s ON r.survey_id = s.survey_id
+        JOIN questions q ON r.question_id = q.question_id
+        LEFT JOIN demographics d ON r.respondent_id = d.respondent_id
+        WHERE s.survey_name = 'Customer Satisfaction Survey'
+    """,
     
-    return queries
-
-if __name__ == "__main__":
-    # Example usage
-    client = SurveyAPIClient()
+    "average_ratings": """
+        SELECT 
+            s.survey_name,
+            q.question_text,
+            AVG(r.answer_numeric) as average_rating,
+            COUNT(*) as response_count
+        FROM responses r
+        JOIN surveys s ON r.survey_id = s.survey_id
+        JOIN questions q ON r.question_id = q.question_id
+        WHERE r.answer_numeric IS NOT NULL
+        GROUP BY s.survey_id, q.question_id
+        ORDER BY average_rating DESC
+    """,
     
-    print("Available example queries:")
+    "demographics_summary": """
+        SELECT 
+            age_group,
+            gender,
+            COUNT(*) as count
+        FROM demographics
+        GROUP BY age_group, gender
+        ORDER BY count DESC
+    """,
+    
+    "response_trends": """
+        SELECT 
+            DATE(r.response_date) as response_date,
+            COUNT(*) as daily_responses
+        FROM responses r
+        GROUP BY DATE(r.response_date)
+        ORDER BY response_date
+    """
+}
+
+def example_queries():
+    """Example queries for the survey database"""
+    return EXAMPLE_QUERIES
+
+async def main():
+    """Analyze all example queries concurrently with the async client"""
     queries = example_queries()
-    for name, query in queries.items():
+
+    async with AsyncSurveyAPIClient() as client:
+        # Fire all analyses at once so the round-trips overlap instead of
+        # paying one RTT per query in a serial loop
+        results = await asyncio.gather(
+            *[client.analyze_query(query) for query in queries.values()],
+            return_exceptions=True
+        )
+
+    print("Available example queries:")
+    for (name, query), analysis in zip(queries.items(), results):
         print(f"\n{name}:")
         print(query)
-        
-        # Demonstrate query analysis
+
         print(f"\nAnalyzing query: {name}")
-        try:
-            analysis = client.analyze_query(query)
-            if analysis.get('is_valid_select'):
-                print("✓ Valid SELECT query")
-                print(f"Tables: {analysis['analysis'].get('tables', [])}")
-                print(f"Has joins: {analysis['analysis'].get('has_joins', False)}")
-                print(f"Has aggregations: {analysis['analysis'].get('has_aggregations', False)}")
-            else:
-                print("✗ Invalid or non-SELECT query")
-        except Exception as e:
-            print(f"Error analyzing query: {e}")
+        if isinstance(analysis, Exception):
+            print(f"Error analyzing query: {analysis}")
+        elif analysis.get('is_valid_select'):
+            print("✓ Valid SELECT query")
+            print(f"Tables: {analysis['analysis'].get('tables', [])}")
+            print(f"Has joins: {analysis['analysis'].get('has_joins', False)}")
+            print(f"Has aggregations: {analysis['analysis'].get('has_aggregations', False)}")
+        else:
+            print("✗ Invalid or non-SELECT query")
         print("-" * 50)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,9 +3,9 @@
 Comprehensive example showing both SQL and RESTful approaches
 """
 
-import requests
+import asyncio
 import json
-from api_client import SurveyAPIClient
+from api_client import AsyncSurveyAPIClient
 
 def print_json(data, title="Response"):
     """Pretty print JSON data"""
@@ -13,10 +13,10 @@ def print_json(data, title="Response"):
     print(json.dumps(data, indent=2))
     print("=" * (len(title) + 8))
 
-def comprehensive_demo():
+async def comprehensive_demo():
     """Demonstrate both SQL and RESTful approaches"""
-    client = SurveyAPIClient("http://localhost:8000")
-    
+    client = AsyncSurveyAPIClient("http://localhost:8000")
+
     print("🚀 Survey Data API Gateway - Comprehensive Demo")
     print("📊 Showing both SQL and RESTful approaches for the same data")
     
@@ -39,36 +39,40 @@ def comprehensive_demo():
     
     print(f"SQL Query:\n{sql_query}")
     
-    # Analyze the query first
-    analysis = client.analyze_query(sql_query)
+    # Analyze and execute the query concurrently - both calls are
+    # independent round-trips, so overlap them with gather
+    analysis, sql_result = await asyncio.gather(
+        client.analyze_query(sql_query),
+        client.execute_query(sql_query)
+    )
     print(f"\n📈 Query Analysis:")
     print(f"- Tables used: {analysis.get('analysis', {}).get('tables', [])}")
     print(f"- Has joins: {analysis.get('analysis', {}).get('has_joins', False)}")
     print(f"- Has aggregations: {analysis.get('analysis', {}).get('has_aggregations', False)}")
-    
-    # Execute the query
-    sql_result = client.execute_query(sql_query)
+
     print_json(sql_result, "SQL Query Result")
-    
+
+    # Fire the RESTful calls for the remaining sections in one batch
+    restful_result, filter_options, analytics = await asyncio.gather(
+        client.get_surveys(status="active"),
+        client.get_filter_options(),
+        client.get_analytics_summary(survey_id=1)
+    )
+
     # Approach 2: RESTful API
     print("\n" + "="*60)
     print("APPROACH 2: Using RESTful API")
     print("="*60)
-    
+
     # Get the same data using RESTful endpoints
     print("RESTful Request: GET /api/surveys?status=active")
-    restful_result = client.get_surveys(status="active")
     print_json(restful_result, "RESTful API Result")
-    
+
     # Show filtering capabilities
     print("\n" + "="*60)
     print("DEMOGRAPHIC FILTERING EXAMPLES")
     print("="*60)
-    
-    # Get filter options
-    print("Getting available filter options...")
-    filter_options = client.get_filter_options()
-    
+
     available_genders = filter_options.get('filter_options', {}).get('genders', [])
     available_age_groups = filter_options.get('filter_options', {}).get('age_groups', [])
     available_locations = filter_options.get('filter_options', {}).get('locations', [])
@@ -79,7 +83,6 @@ def comprehensive_demo():
     
     # Example: Get analytics summary with demographic filtering
     print(f"\n📊 Analytics Summary for Survey ID 1:")
-    analytics = client.get_analytics_summary(survey_id=1)
     print_json(analytics, "Analytics Summary")
     
     print("\n" + "="*60)
@@ -106,5 +109,7 @@ def comprehensive_demo():
     print(f"\n🌐 Interactive Documentation: http://localhost:8000/docs")
     print(f"🔧 Alternative Documentation: http://localhost:8000/redoc")
 
+    await client.aclose()
+
 if __name__ == "__main__":
-    comprehensive_demo()
+    asyncio.run(comprehensive_demo())
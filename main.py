@@ -1,68 +1,36 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
 import sqlite3
-import pandas as pd
-import json
 import os
+import queue
+import re
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
 import sqlglot
 from sqlglot import parse_one, ParseError
-from sqlglot.expressions import Select, Table, Column, Join, Anonymous, Subquery
-import numpy as np
-
-def convert_numpy_types(obj):
-    """Convert numpy types to native Python types for JSON serialization"""
-    if isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, dict):
-        return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    return obj
-
-def safe_dataframe_to_dict(df):
-    """Safely convert DataFrame to dict with proper type conversion"""
-    # Replace numpy NaN with None and convert to native Python types
-    df_clean = df.replace({np.nan: None})
-    records = df_clean.to_dict('records')
-    
-    # Convert numpy types to native Python types
-    clean_records = []
-    for record in records:
-        clean_record = {}
-        for key, value in record.items():
-            if isinstance(value, (np.bool_, bool)):
-                clean_record[str(key)] = bool(value)
-            elif isinstance(value, (np.integer, int)):
-                clean_record[str(key)] = int(value)
-            elif isinstance(value, (np.floating, float)):
-                clean_record[str(key)] = float(value)
-            elif value is None:
-                clean_record[str(key)] = None
-            else:
-                clean_record[str(key)] = str(value) if value is not None else None
-        clean_records.append(clean_record)
-    
-    return clean_records
-from typing import List, Dict, Any, Optional
-import sqlite3
-import pandas as pd
-import json
-import os
-from contextlib import contextmanager
+from sqlglot.expressions import (
+    Anonymous, Avg, Column, Count, GroupConcat, Join, Max, Min, Select,
+    Subquery, Sum, Table
+)
+import orjson
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes numpy scalars and arrays,
+    as a safety net for callers feeding numpy-derived values through."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
 
 app = FastAPI(
     title="Survey Data API Gateway",
     description="REST API Gateway to run SQL queries on survey datasets and retrieve results in JSON format",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=NumpyORJSONResponse
 )
 
 # Add CORS middleware
@@ -74,6 +42,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads - query results repeat column names per
+# row and typically shrink 5-10x under gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Pydantic models
 class QueryRequest(BaseModel):
     query: str = Field(..., description="SQL query to execute")
@@ -107,68 +79,217 @@ class DemographicFilters(BaseModel):
     income_range: Optional[str] = None
     location: Optional[str] = None
 
-# Database connection context manager
-@contextmanager
-def get_db_connection(db_name: str):
-    """Context manager for database connections"""
-    db_path = os.path.join("data", db_name)
-    if not os.path.exists(db_path):
-        raise HTTPException(status_code=404, detail=f"Database {db_name} not found")
-    
-    conn = sqlite3.connect(db_path)
-    try:
-        yield conn
-    finally:
-        conn.close()
+# SQLite connection pooling
+class SqlitePool:
+    """Small per-database pool of reusable SQLite connections.
+
+    Opening a fresh connection per request pays the file open, schema
+    parse and a cold page cache every time; pooled connections are set
+    up once with read-tuned pragmas and keep their page cache warm
+    across requests.
+    """
+
+    def __init__(self, data_dir: str = "data", maxsize: int = 4):
+        self.data_dir = data_dir
+        self.maxsize = maxsize
+        self._pools: Dict[str, queue.Queue] = {}
+        self._lock = threading.Lock()
+
+    def _connect(self, db_name: str) -> sqlite3.Connection:
+        db_path = os.path.join(self.data_dir, db_name)
+        if not os.path.exists(db_path):
+            raise HTTPException(status_code=404, detail=f"Database {db_name} not found")
+
+        # Four times sqlite3's default statement cache (128): the WHERE
+        # templates multiply out per endpoint (data + count + keyset
+        # variants for every filter combination), and a larger cache
+        # keeps those compiled VDBE programs alive instead of reparsing
+        conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=512)
+        # WAL keeps readers lock-free; the mmap window lets large scans
+        # read pages straight from the OS page cache without a read()
+        # syscall per page (mmap_size is an upper bound, not a reservation)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-131072")
+        conn.execute("PRAGMA mmap_size=1073741824")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Rows come back name-addressable everywhere; dict(row) is a
+        # C-level zip of column names to values
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def checkout(self, db_name: str) -> sqlite3.Connection:
+        """Take a connection out of the pool (caller must check it back in)"""
+        with self._lock:
+            db_queue = self._pools.setdefault(db_name, queue.Queue())
+
+        try:
+            return db_queue.get_nowait()
+        except queue.Empty:
+            return self._connect(db_name)
+
+    def checkin(self, db_name: str, conn: sqlite3.Connection):
+        """Return a checked-out connection to the pool"""
+        db_queue = self._pools[db_name]
+        if db_queue.qsize() < self.maxsize:
+            db_queue.put_nowait(conn)
+        else:
+            conn.close()
+
+    @contextmanager
+    def acquire(self, db_name: str):
+        """Context manager yielding a pooled connection for a database"""
+        conn = self.checkout(db_name)
+        try:
+            yield conn
+        finally:
+            self.checkin(db_name, conn)
+
+    def close_all(self):
+        """Close every idle pooled connection (used at app shutdown)"""
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for db_queue in pools.values():
+            while True:
+                try:
+                    db_queue.get_nowait().close()
+                except queue.Empty:
+                    break
+
+pool = SqlitePool()
+
+@app.on_event("startup")
+def ensure_indexes():
+    """Create the indexes the hot endpoints rely on, if missing.
+
+    Runs once per process against every database in the data directory;
+    CREATE INDEX IF NOT EXISTS makes this a no-op after the first boot.
+    """
+    index_ddl = [
+        # Keyset pagination on /api/responses seeks on this ordering
+        "CREATE INDEX IF NOT EXISTS idx_r_date_id ON responses(response_date DESC, response_id DESC)",
+        # Equality filters used by the REST endpoints; location is left
+        # unindexed because its LIKE '%...%' pattern cannot use one
+        "CREATE INDEX IF NOT EXISTS idx_dem_age ON demographics(age_group)",
+        "CREATE INDEX IF NOT EXISTS idx_dem_gender ON demographics(gender)",
+        "CREATE INDEX IF NOT EXISTS idx_dem_edu ON demographics(education_level)",
+        "CREATE INDEX IF NOT EXISTS idx_dem_income ON demographics(income_range)",
+        "CREATE INDEX IF NOT EXISTS idx_resp_survey_date ON responses(survey_id, response_date)",
+        "CREATE INDEX IF NOT EXISTS idx_surv_status_date ON surveys(status, created_date)",
+    ]
+    if not os.path.isdir(pool.data_dir):
+        return
+    for entry in os.scandir(pool.data_dir):
+        if not entry.name.endswith(".db"):
+            continue
+        try:
+            with pool.acquire(entry.name) as conn:
+                for ddl in index_ddl:
+                    conn.execute(ddl)
+                # Refresh planner statistics so the new indexes get picked
+                conn.execute("ANALYZE")
+                conn.commit()
+        except sqlite3.DatabaseError:
+            # Corrupt or stray .db file, or a database without the
+            # expected tables; skip it rather than aborting startup —
+            # direct access to that database surfaces the error
+            continue
+
+@app.on_event("shutdown")
+def close_db_pool():
+    pool.close_all()
+
+@lru_cache(maxsize=2048)
+def _parse_cached(query: str):
+    """Parse SQL once per distinct query string.
+
+    Parsing is pure, so the AST can be cached and shared between
+    analysis and validation instead of re-parsing the same query on
+    every request.
+    """
+    return parse_one(query, dialect="sqlite")
+
+@lru_cache(maxsize=1024)
+def _format_sql(query: str) -> str:
+    """Prettify a query once per distinct string; transpile re-parses and
+    re-renders, so repeated /analyze calls should not pay it again."""
+    return sqlglot.transpile(query, write="sqlite", pretty=True)[0]
 
+# Lowercase so the walk can compare with str.lower() (cheaper than upper()
+# on the typically-lowercase names sqlglot stores) and frozenset for O(1) lookup
+_AGG_FUNCTIONS = frozenset(['count', 'sum', 'avg', 'min', 'max', 'group_concat'])
+
+# sqlglot parses known aggregates into typed nodes, so most never show up
+# as Anonymous; match those by class in the same walk
+_AGG_TYPES = frozenset([Count, Sum, Avg, Min, Max, GroupConcat])
+
+@lru_cache(maxsize=1024)
 def analyze_query(query: str) -> Dict[str, Any]:
     """Analyze SQL query using sqlglot to extract metadata"""
     try:
-        parsed = parse_one(query, dialect="sqlite")
-        
-        analysis = {
+        parsed = _parse_cached(query)
+
+        tables = []
+        columns = []
+        has_joins = False
+        has_aggregations = False
+        has_subqueries = False
+
+        # Single walk over the AST instead of one find_all pass per field
+        for node in parsed.walk():
+            node_type = type(node)
+            if node_type is Table:
+                if node.name:
+                    tables.append(node.name)
+            elif node_type is Column:
+                if node.name:
+                    columns.append(node.name)
+            elif node_type is Join:
+                has_joins = True
+            elif node_type in _AGG_TYPES:
+                has_aggregations = True
+            elif node_type is Anonymous:
+                if not has_aggregations and node.this.lower() in _AGG_FUNCTIONS:
+                    has_aggregations = True
+            elif node_type is Subquery:
+                has_subqueries = True
+
+        return {
             "query_type": type(parsed).__name__,
-            "tables": [],
-            "columns": [],
-            "has_joins": False,
-            "has_aggregations": False,
-            "has_subqueries": False
+            "tables": tables,
+            "columns": columns,
+            "has_joins": has_joins,
+            "has_aggregations": has_aggregations,
+            "has_subqueries": has_subqueries
         }
-        
-        # Extract table names
-        for table in parsed.find_all(Table):
-            if table.name:
-                analysis["tables"].append(table.name)
-        
-        # Extract column names
-        for column in parsed.find_all(Column):
-            if column.name:
-                analysis["columns"].append(column.name)
-        
-        # Check for joins
-        analysis["has_joins"] = len(list(parsed.find_all(Join))) > 0
-        
-        # Check for aggregations
-        agg_functions = ['COUNT', 'SUM', 'AVG', 'MIN', 'MAX', 'GROUP_CONCAT']
-        for func in parsed.find_all(Anonymous):
-            if func.this.upper() in agg_functions:
-                analysis["has_aggregations"] = True
-                break
-        
-        # Check for subqueries
-        analysis["has_subqueries"] = len(list(parsed.find_all(Subquery))) > 0
-        
-        return analysis
-        
+
     except Exception as e:
         return {"error": f"Analysis failed: {str(e)}"}
 
-def is_select_query(query: str) -> bool:
+# Matches a leading SELECT keyword, skipping whitespace and SQL
+# comments. Each alternative is disjoint on its first character (one
+# whitespace char, '--', or '/*') so the scan is linear; a repeated
+# \s+ branch here would backtrack exponentially on non-SELECT input
+_SELECT_PREFIX = re.compile(
+    r'^(?:\s|--[^\n]*\n|/\*.*?\*/)*SELECT\b',
+    re.IGNORECASE | re.DOTALL
+)
+
+def is_select_query(query: str, fast_accept: bool = False) -> bool:
     """Check if the query is a SELECT statement (read-only) using sqlglot"""
+    # Fast path (opt-in, used by /query): a single statement starting
+    # with SELECT cannot write in SQLite, so it is accepted without
+    # parsing. Anything ambiguous (WITH-prefixed queries can front DML,
+    # possible multi-statement input, stray semicolons) falls through
+    # to the sqlglot check. /analyze skips this so unparseable input is
+    # still reported as invalid.
+    if fast_accept and _SELECT_PREFIX.match(query) and ';' not in query.rstrip().rstrip(';'):
+        return True
+
     try:
-        # Parse the SQL query using sqlglot
-        parsed = parse_one(query, dialect="sqlite")
-        
+        # Parse the SQL query using sqlglot (cached per query string)
+        parsed = _parse_cached(query)
+
         # Check if the parsed query is a SELECT statement
         # sqlglot returns Select for SELECT queries, including CTEs (WITH clauses)
         return isinstance(parsed, Select)
@@ -227,69 +348,113 @@ async def root():
         ]
     }
 
-@app.post("/query", response_model=QueryResponse)
-async def execute_query(request: QueryRequest):
+def _stream_query_rows(cursor, columns, query, query_analysis, conn, database):
+    """Yield a /query JSON body row-batch by row-batch.
+
+    Rows are serialized straight off the cursor in fetchmany batches, so
+    memory stays flat no matter how large the result set is; row_count
+    is emitted last, once it is known.
+    """
+    try:
+        header = orjson.dumps({
+            "success": True,
+            "columns": columns,
+            "error": None,
+            "query": query,
+            "analysis": query_analysis
+        })
+        yield header[:-1] + b',"data":['
+
+        row_count = 0
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            chunk = b",".join(orjson.dumps(dict(row)) for row in rows)
+            yield b"," + chunk if row_count else chunk
+            row_count += len(rows)
+
+        yield b'],"row_count":%d}' % row_count
+    finally:
+        pool.checkin(database, conn)
+
+@app.post("/query", response_class=ORJSONResponse)
+def execute_query(request: QueryRequest):
     """Execute SQL query and return results in JSON format"""
+    # Analyze once up front; the cached AST also serves the SELECT-only
+    # check below, and the error branches reuse this analysis as-is
+    query_analysis = analyze_query(request.query)
+
     try:
-        # Analyze the query first
-        query_analysis = analyze_query(request.query)
-        
         # Security check - only allow SELECT queries
-        if not is_select_query(request.query):
-            return QueryResponse(
-                success=False,
-                error="Only SELECT queries are allowed for security reasons",
-                query=request.query,
-                analysis=query_analysis
-            )
-        
-        with get_db_connection(request.database) as conn:
-            # Execute query using pandas for better JSON serialization
-            df = pd.read_sql_query(request.query, conn)
-            
-            # Convert DataFrame to JSON-serializable format with type safety
-            data = safe_dataframe_to_dict(df)
-            columns = df.columns.tolist()
-            row_count = len(df)
-            
-            return QueryResponse(
-                success=True,
-                data=data, # type: ignore
-                columns=columns,
-                row_count=row_count,
-                query=request.query,
-                analysis=query_analysis
-            )
-            
-    except sqlite3.Error as e:
-        return QueryResponse(
-            success=False,
-            error=f"Database error: {str(e)}",
-            query=request.query,
-            analysis=analyze_query(request.query) if 'query_analysis' not in locals() else query_analysis
+        if not is_select_query(request.query, fast_accept=True):
+            return {
+                "success": False,
+                "data": None,
+                "columns": None,
+                "row_count": None,
+                "error": "Only SELECT queries are allowed for security reasons",
+                "query": request.query,
+                "analysis": query_analysis
+            }
+
+        # Hold the connection out of the pool for the lifetime of the
+        # stream; the generator checks it back in when the body is done
+        conn = pool.checkout(request.database)
+        try:
+            cursor = conn.execute(request.query)
+            columns = [description[0] for description in cursor.description]
+        except BaseException:
+            pool.checkin(request.database, conn)
+            raise
+
+        return StreamingResponse(
+            _stream_query_rows(cursor, columns, request.query, query_analysis, conn, request.database),
+            media_type="application/json"
         )
+
+    except sqlite3.Error as e:
+        return {
+            "success": False,
+            "data": None,
+            "columns": None,
+            "row_count": None,
+            "error": f"Database error: {str(e)}",
+            "query": request.query,
+            "analysis": query_analysis
+        }
     except Exception as e:
-        return QueryResponse(
-            success=False,
-            error=f"Unexpected error: {str(e)}",
-            query=request.query,
-            analysis=analyze_query(request.query) if 'query_analysis' not in locals() else query_analysis
-        )
+        return {
+            "success": False,
+            "data": None,
+            "columns": None,
+            "row_count": None,
+            "error": f"Unexpected error: {str(e)}",
+            "query": request.query,
+            "analysis": query_analysis
+        }
 
 @app.post("/analyze")
-async def analyze_sql_query(request: QueryRequest):
+def analyze_sql_query(
+    request: QueryRequest,
+    pretty: bool = Query(True, description="Include the prettified query in the response")
+):
     """Analyze SQL query without executing it"""
     try:
         analysis = analyze_query(request.query)
         is_valid_select = is_select_query(request.query)
-        
+
+        formatted_query = None
+        if pretty and analysis.get("error") is None:
+            formatted_query = _format_sql(request.query)
+
         return {
             "query": request.query,
             "is_valid_select": is_valid_select,
             "analysis": analysis,
-            "formatted_query": sqlglot.transpile(request.query, write="sqlite", pretty=True)[0] if analysis.get("error") is None else None
+            "formatted_query": formatted_query
         }
-        
+
     except Exception as e:
         return {
             "query": request.query,
@@ -299,64 +464,230 @@ async def analyze_sql_query(request: QueryRequest):
             "formatted_query": None
         }
 
+_database_cache = {"mtime": -1, "databases": []}
+
 @app.get("/databases")
-async def list_databases():
+def list_databases(request: Request):
     """List all available databases"""
     data_dir = "data"
     if not os.path.exists(data_dir):
         return {"databases": []}
-    
-    databases = []
-    for file in os.listdir(data_dir):
-        if file.endswith('.db'):
-            databases.append(file)
-    
-    return {"databases": databases}
+
+    # The data directory rarely changes; only rescan it when its mtime
+    # moves, and use scandir to avoid a stat call per entry
+    mtime = os.stat(data_dir).st_mtime_ns
+    etag = f'W/"{mtime:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, **_METADATA_CACHE_HEADERS})
+
+    if mtime != _database_cache["mtime"]:
+        with os.scandir(data_dir) as entries:
+            _database_cache["databases"] = [
+                entry.name for entry in entries
+                if entry.is_file() and entry.name.endswith(".db")
+            ]
+        _database_cache["mtime"] = mtime
+
+    return NumpyORJSONResponse(
+        {"databases": _database_cache["databases"]},
+        headers={"ETag": etag, **_METADATA_CACHE_HEADERS}
+    )
 
 @app.get("/tables/{database}")
-async def list_tables(database: str):
+def list_tables(database: str, request: Request):
     """List all tables in a specific database"""
-    try:
-        with get_db_connection(database) as conn:
+    etag = _db_etag(database)
+
+    def build():
+        with pool.acquire(database) as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [{"name": row[0]} for row in cursor.fetchall()]
-            
-            # Get additional info for each table
-            table_info = []
-            for table in tables:
-                cursor.execute(f"PRAGMA table_info({table['name']});")
-                columns = cursor.fetchall()
-                cursor.execute(f"SELECT COUNT(*) FROM {table['name']};")
-                row_count = cursor.fetchone()[0]
-                
-                table_info.append({
-                    "name": table['name'],
-                    "columns": [{"name": col[1], "type": col[2]} for col in columns],
-                    "row_count": row_count
-                })
-            
-            return DatabaseInfo(database=database, tables=table_info)
-            
+
+            # One statement for all column metadata via the
+            # pragma_table_info table-valued function, instead of a
+            # PRAGMA round-trip per table
+            cursor.execute("""
+                SELECT m.name, p.name, p.type
+                FROM sqlite_master m, pragma_table_info(m.name) p
+                WHERE m.type = 'table'
+                ORDER BY m.name, p.cid
+            """)
+
+            columns_by_table: Dict[str, List[Dict[str, Any]]] = {}
+            for table_name, column_name, column_type in cursor.fetchall():
+                columns_by_table.setdefault(table_name, []).append(
+                    {"name": column_name, "type": column_type}
+                )
+
+            # One UNION ALL statement for all the exact row counts
+            row_counts = {}
+            if columns_by_table:
+                count_query = " UNION ALL ".join(
+                    "SELECT '{literal}' AS name, COUNT(*) FROM \"{ident}\"".format(
+                        literal=name.replace("'", "''"),
+                        ident=name.replace('"', '""')
+                    )
+                    for name in columns_by_table
+                )
+                row_counts = dict(cursor.execute(count_query).fetchall())
+
+            table_info = [
+                {
+                    "name": name,
+                    "columns": columns,
+                    "row_count": row_counts.get(name, 0)
+                }
+                for name, columns in columns_by_table.items()
+            ]
+
+            return {"database": database, "tables": table_info}
+
+    try:
+        return _etag_response("tables", database, etag, request, build)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error accessing database: {str(e)}")
 
+# WHERE fragments per endpoint, in a fixed order so a given filter
+# combination always compiles to the same SQL string (and therefore hits
+# the connection's prepared-statement cache)
+_FILTER_FRAGMENTS = {
+    "surveys": {
+        "status": "status = ?",
+        "created_after": "created_date >= ?",
+        "created_before": "created_date <= ?",
+    },
+    "responses": {
+        "survey_id": "r.survey_id = ?",
+        "age_group": "d.age_group = ?",
+        "gender": "d.gender = ?",
+        "location": "d.location LIKE ?",
+        "education_level": "d.education_level = ?",
+        "income_range": "d.income_range = ?",
+        "response_after": "DATE(r.response_date) >= ?",
+        "response_before": "DATE(r.response_date) <= ?",
+    },
+    "demographics": {
+        "age_group": "age_group = ?",
+        "gender": "gender = ?",
+        "education_level": "education_level = ?",
+        "income_range": "income_range = ?",
+        "location": "location LIKE ?",
+    },
+}
+
+# (endpoint, active-filter set) -> (joined WHERE sql, ordered param names);
+# repeated filter combinations skip the string assembly entirely
+_WHERE_TEMPLATES: Dict[Any, Any] = {}
+
+def _where_template(endpoint: str, active: Dict[str, Any]):
+    """Compiled WHERE clause and param order for a set of active filters.
+
+    Callers pass filter values already in bind form (e.g. LIKE patterns
+    wrapped in %); the returned order maps them onto the placeholders.
+    """
+    key = (endpoint, frozenset(active))
+    template = _WHERE_TEMPLATES.get(key)
+    if template is None:
+        fragments = _FILTER_FRAGMENTS[endpoint]
+        order = tuple(name for name in fragments if name in active)
+        template = (" AND ".join(fragments[name] for name in order), order)
+        _WHERE_TEMPLATES[key] = template
+    return template
+
+# Metadata only changes when a database file is replaced, so let
+# clients and shared caches reuse it for a minute without a round-trip;
+# after expiry the weak ETag revalidates it for the cost of a 304
+_METADATA_CACHE_HEADERS = {"Cache-Control": "public, max-age=60"}
+
+def _db_etag(database: str) -> str:
+    """Weak ETag for a database file, derived from its mtime and size"""
+    try:
+        s = os.stat(os.path.join("data", database))
+    except OSError:
+        raise HTTPException(status_code=404, detail=f"Database {database} not found")
+    return f'W/"{s.st_mtime_ns:x}-{s.st_size:x}"'
+
+# (endpoint, key) -> (etag, payload): metadata only changes when the
+# database file does, so a matching If-None-Match costs no DB work at
+# all and a fresh repeat reuses the built payload
+_etag_payload_cache: Dict[Any, Any] = {}
+
+def _etag_response(endpoint: str, key, etag: str, request: Request, build):
+    """Serve a conditional-GET metadata payload.
+
+    Returns 304 when the client's If-None-Match matches, otherwise the
+    payload (built at most once per etag) with the ETag header set.
+    """
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, **_METADATA_CACHE_HEADERS})
+
+    cached = _etag_payload_cache.get((endpoint, key))
+    if cached is not None and cached[0] == etag:
+        payload = cached[1]
+    else:
+        payload = build()
+        _etag_payload_cache[(endpoint, key)] = (etag, payload)
+    return NumpyORJSONResponse(payload, headers={"ETag": etag, **_METADATA_CACHE_HEADERS})
+
+# Memoized table-name sets per database, keyed on file mtime so the
+# whitelist refreshes if the database is regenerated
+_table_names_cache: Dict[str, Any] = {}
+
+def _table_names(database: str) -> set:
+    """Set of table names in a database, fetched once per file version"""
+    try:
+        mtime = os.stat(os.path.join("data", database)).st_mtime_ns
+    except OSError:
+        raise HTTPException(status_code=404, detail=f"Database {database} not found")
+    cached = _table_names_cache.get(database)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with pool.acquire(database) as conn:
+        names = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        )}
+    _table_names_cache[database] = (mtime, names)
+    return names
+
 @app.get("/sample/{database}/{table}")
-async def get_sample_data(database: str, table: str, limit: int = 10):
+def get_sample_data(database: str, table: str, limit: int = Query(10, ge=1, le=1000, description="Number of sample rows to return")):
     """Get sample data from a specific table"""
+    # Previews are a known-safe query shape: validate the identifier
+    # against the schema and bind the limit instead of routing through
+    # the full /query pipeline
+    if not table.isidentifier():
+        raise HTTPException(status_code=400, detail=f"Invalid table name: {table}")
+
     try:
-        query = f"SELECT * FROM {table} LIMIT {limit};"
-        request = QueryRequest(query=query, database=database)
-        return await execute_query(request)
-        
+        if table not in _table_names(database):
+            raise HTTPException(status_code=404, detail=f"Table {table} not found in {database}")
+
+        with pool.acquire(database) as conn:
+            cursor = conn.execute(f'SELECT * FROM "{table}" LIMIT ?', (limit,))
+            columns = [description[0] for description in cursor.description]
+            data = [dict(row) for row in cursor.fetchall()]
+
+            return {
+                "success": True,
+                "data": data,
+                "columns": columns,
+                "row_count": len(data)
+            }
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching sample data: {str(e)}")
 
 @app.get("/schema/{database}/{table}")
-async def get_table_schema(database: str, table: str):
+def get_table_schema(database: str, table: str, request: Request):
     """Get detailed schema information for a specific table"""
-    try:
-        with get_db_connection(database) as conn:
+    etag = _db_etag(database)
+
+    def build():
+        with pool.acquire(database) as conn:
             cursor = conn.cursor()
             
             # Get table info
@@ -402,72 +733,93 @@ async def get_table_schema(database: str, table: str):
             }
             
             return schema_info
-            
+
+    try:
+        return _etag_response("schema", (database, table), etag, request, build)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching schema: {str(e)}")
 
 # RESTful API endpoints for filtered data access
-@app.get("/api/surveys", response_model=SurveyDataResponse)
-async def get_surveys(
+@app.get("/api/surveys", responses={200: {"model": SurveyDataResponse}})
+def get_surveys(
     status: Optional[str] = Query(None, description="Filter by survey status (active, completed)"),
     created_after: Optional[str] = Query(None, description="Filter surveys created after date (YYYY-MM-DD)"),
     created_before: Optional[str] = Query(None, description="Filter surveys created before date (YYYY-MM-DD)"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
+    with_total: bool = Query(False, description="Run the extra COUNT query and include total_count"),
     database: str = Query("survey.db", description="Database to query")
 ):
-    """Get surveys with optional filtering"""
+    """Get surveys with optional filtering.
+
+    total_count is only computed when with_total=true; has_more comes
+    from peeking one row past the requested limit instead.
+    """
     try:
-        with get_db_connection(database) as conn:
-            # Build dynamic query
-            where_conditions = []
-            params = []
-            
-            if status:
-                where_conditions.append("status = ?")
-                params.append(status)
-            
-            if created_after:
-                where_conditions.append("created_date >= ?")
-                params.append(created_after)
-                
-            if created_before:
-                where_conditions.append("created_date <= ?")
-                params.append(created_before)
-            
-            where_clause = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-            
-            # Get total count
-            count_query = f"SELECT COUNT(*) FROM surveys{where_clause}"
-            count_result = pd.read_sql_query(count_query, conn, params=params)
-            total_count = int(count_result.iloc[0, 0])
-            
-            # Get filtered data
-            data_query = f"SELECT * FROM surveys{where_clause} LIMIT {limit} OFFSET {offset}"
-            df = pd.read_sql_query(data_query, conn, params=params)
+        with pool.acquire(database) as conn:
+            active = {name: value for name, value in (
+                ("status", status),
+                ("created_after", created_after),
+                ("created_before", created_before),
+            ) if value}
+            where_sql, param_order = _where_template("surveys", active)
+            params = [active[name] for name in param_order]
+            where_clause = f" WHERE {where_sql}" if where_sql else ""
             
-            return SurveyDataResponse(
-                success=True,
-                data=safe_dataframe_to_dict(df),
-                total_count=total_count,
-                filtered_count=len(df),
-                filters_applied={
+            # Count only on request; has_more comes from the peek row below
+            total_count = None
+            if with_total:
+                count_query = f"SELECT COUNT(*) FROM surveys{where_clause}"
+                total_count = conn.execute(count_query, params).fetchone()[0]
+
+            # Fetch one row past the limit to learn whether more exist,
+            # straight off the cursor; a SELECT * with no transformation
+            # has no use for a DataFrame in the middle
+            data_query = f"SELECT * FROM surveys{where_clause} LIMIT {limit + 1} OFFSET {offset}"
+            data = [dict(row) for row in conn.execute(data_query, params)]
+            has_more = len(data) > limit
+            data = data[:limit]
+
+            return NumpyORJSONResponse({
+                "success": True,
+                "data": data,
+                "total_count": total_count,
+                "filtered_count": len(data),
+                "filters_applied": {
                     "status": status,
                     "created_after": created_after,
                     "created_before": created_before
                 },
-                pagination={
+                "pagination": {
                     "limit": limit,
                     "offset": offset,
-                    "has_more": (offset + len(df)) < total_count
+                    "has_more": has_more
                 }
-            )
+            })
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching surveys: {str(e)}")
 
-@app.get("/api/responses", response_model=SurveyDataResponse)
-async def get_responses(
+def _stream_ndjson_rows(cursor, conn, database):
+    """Yield rows as NDJSON, one object per line, in fetchmany batches.
+
+    Like the /query stream, the connection stays checked out until the
+    body is done and memory stays flat regardless of result size.
+    """
+    try:
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            yield b"".join(orjson.dumps(dict(row)) + b"\n" for row in rows)
+    finally:
+        pool.checkin(database, conn)
+
+@app.get("/api/responses", responses={200: {"model": SurveyDataResponse}})
+def get_responses(
+    request: Request,
     survey_id: Optional[int] = Query(None, description="Filter by survey ID"),
     survey_name: Optional[str] = Query(None, description="Filter by survey name"),
     age_group: Optional[str] = Query(None, description="Filter by age group (e.g., '25-34', '35-44')"),
@@ -478,12 +830,19 @@ async def get_responses(
     response_after: Optional[str] = Query(None, description="Filter responses after date (YYYY-MM-DD)"),
     response_before: Optional[str] = Query(None, description="Filter responses before date (YYYY-MM-DD)"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    offset: int = Query(0, ge=0, description="Number of records to skip"),
+    offset: int = Query(0, ge=0, description="Number of records to skip (slow for deep pages; prefer the cursor)"),
+    after_date: Optional[str] = Query(None, description="Keyset cursor: response_date of the last row of the previous page"),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: response_id of the last row of the previous page"),
+    with_total: bool = Query(False, description="Run the extra COUNT query and include total_count"),
     database: str = Query("survey.db", description="Database to query")
 ):
-    """Get survey responses with comprehensive filtering including demographics"""
+    """Get survey responses with comprehensive filtering including demographics.
+
+    total_count is only computed when with_total=true; has_more comes
+    from peeking one row past the requested limit instead.
+    """
     try:
-        with get_db_connection(database) as conn:
+        with pool.acquire(database) as conn:
             # Build comprehensive join query
             base_query = """
             SELECT 
@@ -508,61 +867,106 @@ async def get_responses(
             LEFT JOIN demographics d ON r.respondent_id = d.respondent_id
             """
             
-            where_conditions = []
-            params = []
-            
-            if survey_id:
-                where_conditions.append("r.survey_id = ?")
-                params.append(survey_id)
-                
+            # Filters on the driver tables (responses/demographics) apply to
+            # both queries; the surveys filter becomes an EXISTS for the count
+            # so counting never executes the full four-table join
+            active = {name: value for name, value in (
+                ("survey_id", survey_id),
+                ("age_group", age_group),
+                ("gender", gender),
+                ("location", f"%{location}%" if location else None),
+                ("education_level", education_level),
+                ("income_range", income_range),
+                ("response_after", response_after),
+                ("response_before", response_before),
+            ) if value}
+            where_sql, param_order = _where_template("responses", active)
+            driver_conditions = [where_sql] if where_sql else []
+            driver_params = [active[name] for name in param_order]
+
+            data_conditions = list(driver_conditions)
+            data_params = list(driver_params)
+            count_conditions = list(driver_conditions)
+            count_params = list(driver_params)
+
             if survey_name:
-                where_conditions.append("s.survey_name LIKE ?")
-                params.append(f"%{survey_name}%")
-                
-            if age_group:
-                where_conditions.append("d.age_group = ?")
-                params.append(age_group)
-                
-            if gender:
-                where_conditions.append("d.gender = ?")
-                params.append(gender)
-                
-            if location:
-                where_conditions.append("d.location LIKE ?")
-                params.append(f"%{location}%")
-                
-            if education_level:
-                where_conditions.append("d.education_level = ?")
-                params.append(education_level)
-                
-            if income_range:
-                where_conditions.append("d.income_range = ?")
-                params.append(income_range)
-                
-            if response_after:
-                where_conditions.append("DATE(r.response_date) >= ?")
-                params.append(response_after)
-                
-            if response_before:
-                where_conditions.append("DATE(r.response_date) <= ?")
-                params.append(response_before)
-            
-            where_clause = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-            
-            # Get total count
-            count_query = f"SELECT COUNT(*) FROM ({base_query}{where_clause}) as filtered_data"
-            total_count = pd.read_sql_query(count_query, conn, params=params).iloc[0, 0]
-            
-            # Get filtered data with pagination
-            full_query = f"{base_query}{where_clause} ORDER BY r.response_date DESC LIMIT {limit} OFFSET {offset}"
-            df = pd.read_sql_query(full_query, conn, params=params)
+                data_conditions.append("s.survey_name LIKE ?")
+                data_params.append(f"%{survey_name}%")
+                count_conditions.append(
+                    "EXISTS (SELECT 1 FROM surveys s WHERE s.survey_id = r.survey_id AND s.survey_name LIKE ?)"
+                )
+                count_params.append(f"%{survey_name}%")
+            else:
+                # base_query inner-joins surveys, so mirror that constraint
+                count_conditions.append("EXISTS (SELECT 1 FROM surveys s WHERE s.survey_id = r.survey_id)")
+
+            # base_query also inner-joins questions
+            count_conditions.append("EXISTS (SELECT 1 FROM questions q WHERE q.question_id = r.question_id)")
+
+            # Keyset pagination: seek past the previous page's last row
+            # instead of scanning and discarding `offset` rows
+            use_cursor = after_date is not None and after_id is not None
+            if use_cursor:
+                data_conditions.append("(r.response_date, r.response_id) < (?, ?)")
+                data_params.extend([after_date, after_id])
+
+            where_clause = " WHERE " + " AND ".join(data_conditions) if data_conditions else ""
+
+            # Large exports can opt into NDJSON (one object per line,
+            # no envelope) and get the rows streamed straight off a
+            # checked-out cursor instead of a materialized list
+            if "application/x-ndjson" in request.headers.get("accept", ""):
+                ndjson_query = (
+                    f"{base_query}{where_clause}"
+                    f" ORDER BY r.response_date DESC, r.response_id DESC LIMIT {limit}"
+                )
+                stream_conn = pool.checkout(database)
+                try:
+                    cursor = stream_conn.execute(ndjson_query, data_params)
+                except BaseException:
+                    pool.checkin(database, stream_conn)
+                    raise
+                return StreamingResponse(
+                    _stream_ndjson_rows(cursor, stream_conn, database),
+                    media_type="application/x-ndjson"
+                )
+
+            # Count on the driver table with semi-joins instead of
+            # materializing the whole join just to count its rows - and
+            # only when the caller asked for the total
+            total_count = None
+            if with_total:
+                count_query = (
+                    "SELECT COUNT(*) FROM responses r "
+                    "LEFT JOIN demographics d ON r.respondent_id = d.respondent_id "
+                    "WHERE " + " AND ".join(count_conditions)
+                )
+                total_count = conn.execute(count_query, count_params).fetchone()[0]
+
+            # Fetch one row past the limit to learn whether more exist
+            # (OFFSET kept as the slow fallback when no cursor is
+            # supplied); rows come straight off the cursor
+            page_clause = f" LIMIT {limit + 1}" if use_cursor else f" LIMIT {limit + 1} OFFSET {offset}"
+            full_query = f"{base_query}{where_clause} ORDER BY r.response_date DESC, r.response_id DESC{page_clause}"
+            data = [dict(row) for row in conn.execute(full_query, data_params)]
+            has_more = len(data) > limit
+            data = data[:limit]
+
+            if has_more and data:
+                last = data[-1]
+                next_cursor = {
+                    "after_date": last["response_date"],
+                    "after_id": last["response_id"]
+                }
+            else:
+                next_cursor = None
             
-            return SurveyDataResponse(
-                success=True,
-                data=df.to_dict('records'),
-                total_count=total_count,
-                filtered_count=len(df),
-                filters_applied={
+            return NumpyORJSONResponse({
+                "success": True,
+                "data": data,
+                "total_count": total_count,
+                "filtered_count": len(data),
+                "filters_applied": {
                     "survey_id": survey_id,
                     "survey_name": survey_name,
                     "age_group": age_group,
@@ -573,18 +977,19 @@ async def get_responses(
                     "response_after": response_after,
                     "response_before": response_before
                 },
-                pagination={
+                "pagination": {
                     "limit": limit,
                     "offset": offset,
-                    "has_more": (offset + len(df)) < total_count
+                    "has_more": has_more,
+                    "next_cursor": next_cursor
                 }
-            )
+            })
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching responses: {str(e)}")
 
-@app.get("/api/demographics", response_model=SurveyDataResponse)
-async def get_demographics(
+@app.get("/api/demographics", responses={200: {"model": SurveyDataResponse}})
+def get_demographics(
     age_group: Optional[str] = Query(None, description="Filter by age group"),
     gender: Optional[str] = Query(None, description="Filter by gender"),
     education_level: Optional[str] = Query(None, description="Filter by education level"),
@@ -592,68 +997,64 @@ async def get_demographics(
     location: Optional[str] = Query(None, description="Filter by location"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
     offset: int = Query(0, ge=0, description="Number of records to skip"),
+    with_total: bool = Query(False, description="Run the extra COUNT query and include total_count"),
     database: str = Query("survey.db", description="Database to query")
 ):
-    """Get demographic data with filtering"""
+    """Get demographic data with filtering.
+
+    total_count is only computed when with_total=true; has_more comes
+    from peeking one row past the requested limit instead.
+    """
     try:
-        with get_db_connection(database) as conn:
-            where_conditions = []
-            params = []
-            
-            if age_group:
-                where_conditions.append("age_group = ?")
-                params.append(age_group)
-                
-            if gender:
-                where_conditions.append("gender = ?")
-                params.append(gender)
-                
-            if education_level:
-                where_conditions.append("education_level = ?")
-                params.append(education_level)
-                
-            if income_range:
-                where_conditions.append("income_range = ?")
-                params.append(income_range)
-                
-            if location:
-                where_conditions.append("location LIKE ?")
-                params.append(f"%{location}%")
-            
-            where_clause = " WHERE " + " AND ".join(where_conditions) if where_conditions else ""
+        with pool.acquire(database) as conn:
+            active = {name: value for name, value in (
+                ("age_group", age_group),
+                ("gender", gender),
+                ("education_level", education_level),
+                ("income_range", income_range),
+                ("location", f"%{location}%" if location else None),
+            ) if value}
+            where_sql, param_order = _where_template("demographics", active)
+            params = [active[name] for name in param_order]
+            where_clause = f" WHERE {where_sql}" if where_sql else ""
             
-            # Get total count
-            count_query = f"SELECT COUNT(*) FROM demographics{where_clause}"
-            total_count = pd.read_sql_query(count_query, conn, params=params).iloc[0, 0]
-            
-            # Get filtered data
-            data_query = f"SELECT * FROM demographics{where_clause} LIMIT {limit} OFFSET {offset}"
-            df = pd.read_sql_query(data_query, conn, params=params)
-            
-            return SurveyDataResponse(
-                success=True,
-                data=df.to_dict('records'),
-                total_count=total_count,
-                filtered_count=len(df),
-                filters_applied={
+            # Count only on request; has_more comes from the peek row below
+            total_count = None
+            if with_total:
+                count_query = f"SELECT COUNT(*) FROM demographics{where_clause}"
+                total_count = conn.execute(count_query, params).fetchone()[0]
+
+            # Fetch one row past the limit to learn whether more exist,
+            # straight off the cursor
+            data_query = f"SELECT * FROM demographics{where_clause} LIMIT {limit + 1} OFFSET {offset}"
+            data = [dict(row) for row in conn.execute(data_query, params)]
+            has_more = len(data) > limit
+            data = data[:limit]
+
+            return NumpyORJSONResponse({
+                "success": True,
+                "data": data,
+                "total_count": total_count,
+                "filtered_count": len(data),
+                "filters_applied": {
                     "age_group": age_group,
                     "gender": gender,
                     "education_level": education_level,
                     "income_range": income_range,
                     "location": location
                 },
-                pagination={
+                "pagination": {
                     "limit": limit,
                     "offset": offset,
-                    "has_more": (offset + len(df)) < total_count
+                    "has_more": has_more
                 }
-            )
-            
+            })
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching demographics: {str(e)}")
 
 @app.get("/api/analytics/summary")
-async def get_analytics_summary(
+def get_analytics_summary(
     survey_id: Optional[int] = Query(None, description="Filter by survey ID"),
     age_group: Optional[str] = Query(None, description="Filter by age group"),
     gender: Optional[str] = Query(None, description="Filter by gender"),
@@ -662,7 +1063,7 @@ async def get_analytics_summary(
 ):
     """Get analytics summary with optional demographic filtering"""
     try:
-        with get_db_connection(database) as conn:
+        with pool.acquire(database) as conn:
             # Build base analytics query
             base_query = """
             SELECT 
@@ -703,68 +1104,75 @@ async def get_analytics_summary(
             group_clause = " GROUP BY s.survey_id, s.survey_name, d.age_group, d.gender, d.location"
             
             full_query = f"{base_query}{where_clause}{group_clause}"
-            df = pd.read_sql_query(full_query, conn, params=params)
-            
+            summary = [dict(row) for row in conn.execute(full_query, params)]
+
             return {
                 "success": True,
-                "summary": df.to_dict('records'),
+                "summary": summary,
                 "filters_applied": {
                     "survey_id": survey_id,
                     "age_group": age_group,
                     "gender": gender,
                     "location": location
                 },
-                "total_records": len(df)
+                "total_records": len(summary)
             }
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating analytics: {str(e)}")
 
+# One statement for every filter vocabulary; GROUP BY gives the same
+# distinct values as the seven separate SELECT DISTINCT round-trips did
+_FILTER_OPTIONS_SQL = """
+    SELECT 'survey_status' AS k, status AS v FROM surveys WHERE status IS NOT NULL GROUP BY status
+    UNION ALL SELECT 'age_groups', age_group FROM demographics WHERE age_group IS NOT NULL GROUP BY age_group
+    UNION ALL SELECT 'genders', gender FROM demographics WHERE gender IS NOT NULL GROUP BY gender
+    UNION ALL SELECT 'education_levels', education_level FROM demographics WHERE education_level IS NOT NULL GROUP BY education_level
+    UNION ALL SELECT 'income_ranges', income_range FROM demographics WHERE income_range IS NOT NULL GROUP BY income_range
+    UNION ALL SELECT 'locations', location FROM demographics WHERE location IS NOT NULL GROUP BY location
+    UNION ALL SELECT 'survey_names', survey_name FROM surveys
+"""
+
 @app.get("/api/filters/options")
-async def get_filter_options(database: str = Query("survey.db", description="Database to query")):
+def get_filter_options(request: Request, database: str = Query("survey.db", description="Database to query")):
     """Get available filter options for all filterable fields"""
+    etag = _db_etag(database)
+
+    def build():
+        # Filter vocabularies only change when the database file does,
+        # so the etag cache holds the built payload until then
+        options = {
+            "survey_status": [], "age_groups": [], "genders": [],
+            "education_levels": [], "income_ranges": [], "locations": [],
+            "survey_names": []
+        }
+        with pool.acquire(database) as conn:
+            for key, value in conn.execute(_FILTER_OPTIONS_SQL):
+                options[key].append(value)
+
+        return {
+            "success": True,
+            "filter_options": options,
+            "description": "Available filter values for RESTful API endpoints"
+        }
+
     try:
-        with get_db_connection(database) as conn:
-            # Get unique values for each filterable field
-            options = {}
-            
-            # Survey statuses
-            survey_status_df = pd.read_sql_query("SELECT DISTINCT status FROM surveys WHERE status IS NOT NULL", conn)
-            options["survey_status"] = survey_status_df['status'].tolist()
-            
-            # Age groups
-            age_groups_df = pd.read_sql_query("SELECT DISTINCT age_group FROM demographics WHERE age_group IS NOT NULL", conn)
-            options["age_groups"] = age_groups_df['age_group'].tolist()
-            
-            # Genders
-            genders_df = pd.read_sql_query("SELECT DISTINCT gender FROM demographics WHERE gender IS NOT NULL", conn)
-            options["genders"] = genders_df['gender'].tolist()
-            
-            # Education levels
-            education_df = pd.read_sql_query("SELECT DISTINCT education_level FROM demographics WHERE education_level IS NOT NULL", conn)
-            options["education_levels"] = education_df['education_level'].tolist()
-            
-            # Income ranges
-            income_df = pd.read_sql_query("SELECT DISTINCT income_range FROM demographics WHERE income_range IS NOT NULL", conn)
-            options["income_ranges"] = income_df['income_range'].tolist()
-            
-            # Locations
-            locations_df = pd.read_sql_query("SELECT DISTINCT location FROM demographics WHERE location IS NOT NULL", conn)
-            options["locations"] = locations_df['location'].tolist()
-            
-            # Survey names
-            surveys_df = pd.read_sql_query("SELECT DISTINCT survey_name FROM surveys", conn)
-            options["survey_names"] = surveys_df['survey_name'].tolist()
-            
-            return {
-                "success": True,
-                "filter_options": options,
-                "description": "Available filter values for RESTful API endpoints"
-            }
-            
+        return _etag_response("filter_options", database, etag, request, build)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching filter options: {str(e)}")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # Import string (not the app object) so multiple workers can be spawned;
+    # uvloop + httptools cut per-request event-loop and HTTP-parsing CPU
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=max(2, os.cpu_count() or 2),
+        log_level="warning"
+    )
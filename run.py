@@ -5,26 +5,37 @@ Survey Data API Gateway Startup Script
 
 import os
 import sys
-import subprocess
+import uvicorn
 from setup_database import create_sample_survey_database
 
 def setup_environment():
     """Set up the development environment"""
     print("Setting up Survey Data API Gateway...")
-    
+
     # Create sample database
     print("1. Creating sample survey database...")
     create_sample_survey_database()
-    
+
     # Install dependencies (if needed)
     print("2. Environment setup complete!")
     print("\nTo start the API server, run:")
-    print("uvicorn main:app --reload --host 0.0.0.0 --port 8000")
+    print("python run.py start")
 
 def start_server():
     """Start the FastAPI server"""
     print("Starting Survey Data API Gateway server...")
-    os.system("uvicorn main:app --reload --host 0.0.0.0 --port 8000")
+    # In-process uvicorn instead of shelling out: the import string (not
+    # the app object) allows multiple workers, and uvloop + httptools cut
+    # per-request event-loop and HTTP-parsing CPU
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning"
+    )
 
 if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "start":
@@ -4,25 +4,28 @@ Test script to demonstrate the Survey Data API Gateway with sqlglot integration
 """
 
 import requests
-import json
+import orjson
 from api_client import SurveyAPIClient
 
 def print_json(data, title="Response"):
     """Pretty print JSON data"""
     print(f"\n=== {title} ===")
-    print(json.dumps(data, indent=2))
+    # orjson's C encoder makes the pretty-print free relative to the
+    # stdlib round-trip, which matters once payloads grow
+    print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
     print("=" * (len(title) + 8))
 
 def test_api():
     """Test the API Gateway functionality"""
     client = SurveyAPIClient("http://localhost:8000")
-    
+    session = requests.Session()
+
     print("🚀 Testing Survey Data API Gateway with sqlglot")
     
     # Test 1: Root endpoint
     print("\n1. Testing root endpoint...")
     try:
-        response = requests.get("http://localhost:8000/")
+        response = session.get("http://localhost:8000/")
         print_json(response.json(), "API Information")
     except Exception as e:
         print(f"Error: {e}")
@@ -4,24 +4,30 @@ Test script for RESTful API endpoints
 """
 
 import requests
-import json
+import orjson
 from api_client import SurveyAPIClient
 
 def print_json(data, title="Response"):
     """Pretty print JSON data"""
     print(f"\n=== {title} ===")
-    print(json.dumps(data, indent=2))
+    # orjson's C encoder makes the pretty-print free relative to the
+    # stdlib round-trip, which matters once payloads grow
+    print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
     print("=" * (len(title) + 8))
 
 def test_restful_api():
     """Test the RESTful API endpoints"""
     base_url = "http://localhost:8000"
-    
+
+    # One Session so all seven calls share a keep-alive connection
+    # instead of paying a TCP handshake each
+    session = requests.Session()
+
     print("🚀 Testing RESTful API Endpoints")
     
     # Test 1: Get all surveys
     print("\n1. Testing /api/surveys endpoint...")
-    response = requests.get(f"{base_url}/api/surveys")
+    response = session.get(f"{base_url}/api/surveys")
     if response.status_code == 200:
         print_json(response.json(), "All Surveys")
     else:
@@ -29,7 +35,7 @@ def test_restful_api():
     
     # Test 2: Get surveys with status filter
     print("\n2. Testing /api/surveys with status filter...")
-    response = requests.get(f"{base_url}/api/surveys?status=active")
+    response = session.get(f"{base_url}/api/surveys?status=active")
     if response.status_code == 200:
         print_json(response.json(), "Active Surveys")
     else:
@@ -37,7 +43,7 @@ def test_restful_api():
     
     # Test 3: Get responses (similar to PLFS example)
     print("\n3. Testing /api/responses (like PLFS data)...")
-    response = requests.get(f"{base_url}/api/responses?gender=Female&age_group=25-34&location=New York")
+    response = session.get(f"{base_url}/api/responses?gender=Female&age_group=25-34&location=New York")
     if response.status_code == 200:
         data = response.json()
         print(f"Found {data.get('filtered_count', 0)} responses matching filters:")
@@ -50,7 +56,7 @@ def test_restful_api():
     
     # Test 4: Get demographics with multiple filters
     print("\n4. Testing /api/demographics with filters...")
-    response = requests.get(f"{base_url}/api/demographics?gender=Female&education_level=Bachelor's")
+    response = session.get(f"{base_url}/api/demographics?gender=Female&education_level=Bachelor's")
     if response.status_code == 200:
         print_json(response.json(), "Demographics - Female with Bachelor's")
     else:
@@ -58,7 +64,7 @@ def test_restful_api():
     
     # Test 5: Get analytics summary
     print("\n5. Testing /api/analytics/summary...")
-    response = requests.get(f"{base_url}/api/analytics/summary?survey_id=1")
+    response = session.get(f"{base_url}/api/analytics/summary?survey_id=1")
     if response.status_code == 200:
         print_json(response.json(), "Analytics Summary")
     else:
@@ -66,15 +72,15 @@ def test_restful_api():
     
     # Test 6: Get filter options
     print("\n6. Testing /api/filters/options...")
-    response = requests.get(f"{base_url}/api/filters/options")
+    response = session.get(f"{base_url}/api/filters/options")
     if response.status_code == 200:
         print_json(response.json(), "Available Filter Options")
     else:
         print(f"Error: {response.status_code} - {response.text}")
     
-    # Test 7: Pagination example
+    # Test 7: Pagination example (with_total opts in to the COUNT query)
     print("\n7. Testing pagination...")
-    response = requests.get(f"{base_url}/api/responses?limit=3&offset=0")
+    response = session.get(f"{base_url}/api/responses?limit=3&offset=0&with_total=true")
     if response.status_code == 200:
         data = response.json()
         print(f"Showing {data.get('filtered_count', 0)} of {data.get('total_count', 0)} total responses")